@@ -6,10 +6,17 @@ to settings throughout the application.
 """
 
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dataclasses import dataclass
 
+# Prefer libyaml's C parser (5-20x faster); fall back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class Config:
@@ -17,24 +24,41 @@ class Config:
     
     def __init__(self, config_dict: Dict[str, Any]):
         self._config = config_dict
-    
+        # Precompute dot-path -> leaf value map; config is read-only after
+        # load, so get() becomes a single hash lookup instead of split + walk
+        self._flat: Dict[str, Any] = {}
+        self._flatten(config_dict, "")
+
+    def _flatten(self, node: Dict[str, Any], prefix: str) -> None:
+        """Recursively record every dot-path to a non-dict leaf value."""
+        for key, value in node.items():
+            path = f"{prefix}.{key}" if prefix else key
+            if isinstance(value, dict):
+                self._flatten(value, path)
+            else:
+                self._flat[path] = value
+
     def get(self, key_path: str, default: Any = None) -> Any:
         """
         Get config value using dot notation.
-        
+
         Example:
             config.get("retry.max_retries")  # Returns 3
             config.get("tokens.context_management.hard_prompt_cap")
         """
+        if key_path in self._flat:
+            return self._flat[key_path]
+
+        # Fallback walk for paths resolving to sub-dicts (not in flat map)
         keys = key_path.split(".")
         value = self._config
-        
+
         for key in keys:
             if isinstance(value, dict) and key in value:
                 value = value[key]
             else:
                 return default
-        
+
         return value
     
     def __getitem__(self, key: str) -> Any:
@@ -86,10 +110,14 @@ def load_config(config_path: Optional[str] = None) -> Config:
             f"Current working directory: {Path.cwd()}"
         )
     
-    with open(config_path, "r") as f:
-        config_dict = yaml.safe_load(f)
+    # Read as bytes — libyaml parses bytes faster than str
+    with open(config_path, "rb") as f:
+        config_dict = yaml.load(f, Loader=_YamlLoader)
     
     _config = Config(config_dict)
+    # The memoized accessors below cache values from the previous config;
+    # any reassignment of _config must invalidate them
+    _clear_accessor_caches()
     return _config
 
 
@@ -129,31 +157,37 @@ def reload_config(config_path: Optional[str] = None) -> Config:
 
 # Convenience functions for common config values
 
+@lru_cache(maxsize=None)
 def get_default_provider() -> str:
     """Get default provider."""
     return get_config().get("providers.default", "openai")
 
 
+@lru_cache(maxsize=None)
 def get_enabled_providers() -> list[str]:
     """Get list of enabled providers."""
     return get_config().get("providers.enabled", ["openai"])
 
 
+@lru_cache(maxsize=None)
 def get_max_retries() -> int:
     """Get max retry attempts."""
     return get_config().get("retry.max_retries", 3)
 
 
+@lru_cache(maxsize=None)
 def get_backoff_base() -> float:
     """Get base backoff time in seconds."""
     return get_config().get("retry.backoff.base_seconds", 0.5)
 
 
+@lru_cache(maxsize=None)
 def get_backoff_jitter() -> float:
     """Get backoff jitter factor."""
     return get_config().get("retry.backoff.jitter_factor", 0.25)
 
 
+@lru_cache(maxsize=32)
 def get_default_temperature(task_type: Optional[str] = None) -> float:
     """
     Get default temperature for task type.
@@ -172,6 +206,7 @@ def get_default_temperature(task_type: Optional[str] = None) -> float:
     return get_config().get("defaults.temperature", 0.2)
 
 
+@lru_cache(maxsize=32)
 def get_default_max_tokens(task_type: Optional[str] = None) -> int:
     """
     Get default max_tokens for task type.
@@ -190,11 +225,13 @@ def get_default_max_tokens(task_type: Optional[str] = None) -> int:
     return get_config().get("defaults.max_tokens", 1000)
 
 
+@lru_cache(maxsize=None)
 def is_logging_enabled() -> bool:
     """Check if logging is enabled."""
     return get_config().get("logging.enabled", True)
 
 
+@lru_cache(maxsize=None)
 def get_log_path() -> Path:
     """Get full path to log file."""
     log_dir = get_config().get("logging.output_dir", "logs")
@@ -202,11 +239,36 @@ def get_log_path() -> Path:
     return Path(log_dir) / log_file
 
 
+@lru_cache(maxsize=None)
 def should_auto_route_reasoning() -> bool:
     """Check if automatic reasoning model routing is enabled."""
     return get_config().get("models.auto_routing", True)
 
 
+@lru_cache(maxsize=None)
 def get_reasoning_techniques() -> list[str]:
     """Get list of techniques that trigger reasoning model routing."""
-    return get_config().get("models.reasoning_techniques", ["cot", "tot"])
\ No newline at end of file
+    return get_config().get("models.reasoning_techniques", ["cot", "tot"])
+
+
+# Accessors memoized above; config is immutable between reload_config calls,
+# so caches only need clearing when the config is actually reloaded
+_CACHED_ACCESSORS = (
+    get_default_provider,
+    get_enabled_providers,
+    get_max_retries,
+    get_backoff_base,
+    get_backoff_jitter,
+    get_default_temperature,
+    get_default_max_tokens,
+    is_logging_enabled,
+    get_log_path,
+    should_auto_route_reasoning,
+    get_reasoning_techniques,
+)
+
+
+def _clear_accessor_caches() -> None:
+    """Clear all memoized accessor values after a config reload."""
+    for accessor in _CACHED_ACCESSORS:
+        accessor.cache_clear()
\ No newline at end of file
@@ -7,10 +7,153 @@ Provides tools to:
 - Extract JSON from mixed text
 """
 
+import asyncio
 import json
 import re
-from typing import Any, Dict, Optional, Tuple
-from jsonschema import validate, ValidationError, Draft7Validator
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# jsonschema/fastjsonschema are imported lazily inside _get_validator: the
+# common extract/repair path shouldn't pay their import cost at startup
+
+# orjson's C+SIMD encoder pretty-prints large schemas 5-10x faster than
+# stdlib json; optional, with a stdlib fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Hyperscan fast path: SIMD-accelerated DFA scan to locate JSON
+# candidate starts in one pass on large high-throughput batches
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+# Below this size, Python's C-level str.find beats Hyperscan's setup cost
+_HYPERSCAN_MIN_LEN = 4096
+
+_HS_DB = None
+if hyperscan is not None:
+    _HS_DB = hyperscan.Database()
+    _HS_DB.compile(
+        expressions=[rb"\{", rb"\["],
+        ids=[0, 1],
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * 2,
+    )
+
+
+def _hyperscan_starts(text: str) -> list[int]:
+    """Collect candidate {/[ start offsets with a single vectorized scan."""
+    starts: list[int] = []
+
+    def _on_match(pat_id, start, end, flags, context=None):
+        starts.append(start)
+
+    _HS_DB.scan(text.encode("utf-8", errors="surrogatepass"), match_event_handler=_on_match)
+    starts.sort()
+    return starts
+
+
+# Below this size, thread-dispatch overhead exceeds the parse cost itself
+_ASYNC_THRESHOLD = 64 * 1024
+
+
+# Precompiled patterns (compiling per call re-parses the regex every time)
+_CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```", re.DOTALL)
+_LINE_COMMENT_RE = re.compile(r"//.*?$", re.MULTILINE)
+_BLOCK_COMMENT_RE = re.compile(r"/\*.*?\*/", re.DOTALL)
+_TRAILING_COMMA_RE = re.compile(r",\s*([}\]])")
+_UNQUOTED_KEY_RE = re.compile(r"(\w+):")
+
+# Shared decoder for raw_decode-based extraction (C-implemented parser)
+_DECODER = json.JSONDecoder()
+
+
+def _raw_decode_first(text: str) -> Optional[Tuple[Any, str]]:
+    """
+    Locate and parse the first valid JSON value in text in a single pass.
+
+    Uses json.JSONDecoder.raw_decode, which is C-implemented and both finds
+    and parses the value — no separate regex-locate + json.loads step.
+
+    Args:
+        text: Input text possibly containing JSON
+
+    Returns:
+        Tuple of (parsed_data, raw_json_string) or None
+    """
+    # Hyperscan fast path: all candidate starts located in one SIMD scan.
+    # ASCII-only guard keeps byte offsets aligned with str indices.
+    if _HS_DB is not None and len(text) > _HYPERSCAN_MIN_LEN and text.isascii():
+        for start in _hyperscan_starts(text):
+            try:
+                data, end = _DECODER.raw_decode(text, start)
+                return data, text[start:end]
+            except json.JSONDecodeError:
+                continue
+        return None
+
+    pos = 0
+    n = len(text)
+    while pos < n:
+        i = text.find("{", pos)
+        j = text.find("[", pos)
+        if i == -1 and j == -1:
+            return None
+        start = i if j == -1 or (i != -1 and i < j) else j
+        try:
+            data, end = _DECODER.raw_decode(text, start)
+            return data, text[start:end]
+        except json.JSONDecodeError:
+            pos = start + 1
+    return None
+
+
+def _scan_balanced(text: str, open_ch: str, close_ch: str) -> Optional[str]:
+    """
+    Find the first balanced {...} or [...] region with a single linear scan.
+
+    Tracks nesting depth and string/escape state, so arbitrary nesting and
+    braces inside string literals are handled correctly. O(n) worst case,
+    unlike the previous regex which backtracked badly on large inputs.
+
+    Args:
+        text: Input text to scan
+        open_ch: Opening delimiter ("{" or "[")
+        close_ch: Matching closing delimiter ("}" or "]")
+
+    Returns:
+        Balanced substring including delimiters, or None
+    """
+    start = -1
+    depth = 0
+    in_string = False
+    escape = False
+
+    for i, ch in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            if depth > 0:
+                in_string = True
+        elif ch == open_ch:
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == close_ch and depth > 0:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
 
 
 def extract_json(text: str) -> Optional[str]:
@@ -26,23 +169,25 @@ def extract_json(text: str) -> Optional[str]:
         Extracted JSON string or None
     """
     # Try to find JSON in code blocks first
-    code_block_pattern = r"```(?:json)?\s*(\{.*?\}|\[.*?\])\s*```"
-    matches = re.findall(code_block_pattern, text, re.DOTALL)
+    matches = _CODE_BLOCK_RE.findall(text)
     if matches:
         return matches[0]
 
-    # Try to find standalone JSON object
-    json_pattern = r"(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})"
-    matches = re.findall(json_pattern, text, re.DOTALL)
-    if matches:
-        # Return the longest match (likely most complete)
-        return max(matches, key=len)
+    # Try valid embedded JSON via raw_decode (locates + parses in one C pass)
+    found = _raw_decode_first(text)
+    if found:
+        return found[1]
+
+    # Fall back to balanced-region scan: catches malformed-but-balanced JSON
+    # (e.g., trailing commas) that repair_json can still fix
+    obj = _scan_balanced(text, "{", "}")
+    if obj:
+        return obj
 
     # Try to find JSON array
-    array_pattern = r"(\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\])"
-    matches = re.findall(array_pattern, text, re.DOTALL)
-    if matches:
-        return max(matches, key=len)
+    arr = _scan_balanced(text, "[", "]")
+    if arr:
+        return arr
 
     return None
 
@@ -51,11 +196,16 @@ def repair_json(text: str) -> Tuple[bool, Optional[str], Optional[str]]:
     """
     Attempt to repair common JSON formatting errors.
 
-    Common fixes:
+    Fixes are applied one at a time, most-likely-to-fix first, re-trying the
+    parse after each so a single-issue input (the common case) pays for only
+    one regex pass instead of all of them. The fix list is looped to a
+    fixpoint so fixes that expose new issues (comment removal leaving a
+    trailing comma) still compose:
     - Remove trailing commas
-    - Fix unquoted keys
-    - Replace single quotes with double quotes
     - Remove comments
+    - Replace single quotes with double quotes
+    - Fix unquoted keys
+    - Strip markdown artifacts
 
     Args:
         text: Potentially malformed JSON string
@@ -63,43 +213,99 @@ def repair_json(text: str) -> Tuple[bool, Optional[str], Optional[str]]:
     Returns:
         Tuple of (success: bool, repaired_json: str | None, error: str | None)
     """
-    original_text = text
-    errors = []
-
     try:
         # First, try parsing as-is
         json.loads(text)
         return True, text, None
-    except json.JSONDecodeError:
-        pass
+    except json.JSONDecodeError as e:
+        # Seed with the original parse error so the failure message is
+        # meaningful even when no fix pattern applies
+        last_error = e
+
+    fixes = [
+        # Remove trailing commas (most frequent LLM formatting slip)
+        lambda t: _TRAILING_COMMA_RE.sub(r"\1", t),
+        # Remove comments (// and /* */)
+        lambda t: _BLOCK_COMMENT_RE.sub("", _LINE_COMMENT_RE.sub("", t)),
+        # Replace single quotes with double quotes (simple cases)
+        lambda t: t.replace("'", '"') if "'" in t else t,
+        # Try to fix unquoted keys (basic heuristic)
+        lambda t: _UNQUOTED_KEY_RE.sub(r'"\1":', t),
+        # Remove potential markdown artifacts
+        lambda t: t.strip().strip("`"),
+    ]
+
+    # Each pass can unlock fixes that ran earlier in the list (e.g. comment
+    # removal exposing a trailing comma), so repeat until nothing changes;
+    # len(fixes) passes bounds the worst case
+    for _ in range(len(fixes)):
+        changed = False
+        for fix in fixes:
+            repaired = fix(text)
+            if repaired == text:
+                continue
+            changed = True
+            text = repaired
+            try:
+                json.loads(text)
+                return True, text, None
+            except json.JSONDecodeError as e:
+                last_error = e
+        if not changed:
+            break
 
-    # Remove comments (// and /* */)
-    text = re.sub(r"//.*?$", "", text, flags=re.MULTILINE)
-    text = re.sub(r"/\*.*?\*/", "", text, flags=re.DOTALL)
+    return False, None, f"Repair failed: {last_error}"
 
-    # Remove trailing commas
-    text = re.sub(r",\s*([}\]])", r"\1", text)
 
-    # Replace single quotes with double quotes (simple cases)
-    text = text.replace("'", '"')
+@lru_cache(maxsize=256)
+def _get_validator(schema_key: str) -> Callable[[Any], Any]:
+    """
+    Build (and cache) a compiled validator for a serialized schema.
 
-    # Try to fix unquoted keys (basic heuristic)
-    text = re.sub(r"(\w+):", r'"\1":', text)
+    jsonschema.validate reparses + recompiles the schema on every call;
+    compiling once per distinct schema moves that work out of the hot path.
 
-    # Remove potential markdown artifacts
-    text = text.strip().strip("`")
+    Args:
+        schema_key: json.dumps(schema, sort_keys=True) of the schema
 
+    Returns:
+        Callable that validates an instance, raising on failure
+    """
+    schema = json.loads(schema_key)
+
+    # fastjsonschema generates specialized validation code per schema
+    # (10-100x faster); fall back to reusing a Draft7Validator
     try:
-        json.loads(text)
-        return True, text, None
-    except json.JSONDecodeError as e:
-        return False, None, f"Repair failed: {str(e)}"
+        import fastjsonschema
+        return fastjsonschema.compile(schema)
+    except ImportError:
+        from jsonschema import Draft7Validator
+        return Draft7Validator(schema).validate
+
+
+def compile_schema(schema: Dict[str, Any]) -> Callable[[Any], Any]:
+    """
+    Get a reusable compiled validator for a schema.
+
+    Callers validating many instances against one schema can hold onto the
+    returned callable and skip the per-call schema-hashing step entirely.
+
+    Args:
+        schema: JSON schema definition
+
+    Returns:
+        Callable that validates an instance, raising on failure
+    """
+    return _get_validator(json.dumps(schema, sort_keys=True))
 
 
 def validate_json_schema(data: Any, schema: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
     """
     Validate JSON data against a JSON schema.
 
+    Uses a cached compiled validator per schema instead of re-compiling
+    via jsonschema.validate on every call.
+
     Args:
         data: Parsed JSON data (dict or list)
         schema: JSON schema definition
@@ -107,11 +313,13 @@ def validate_json_schema(data: Any, schema: Dict[str, Any]) -> Tuple[bool, Optio
     Returns:
         Tuple of (valid: bool, error_message: str | None)
     """
+    validator = compile_schema(schema)
     try:
-        validate(instance=data, schema=schema)
+        validator(data)
         return True, None
-    except ValidationError as e:
-        return False, f"Schema validation failed: {e.message}"
+    except Exception as e:
+        message = getattr(e, "message", str(e))
+        return False, f"Schema validation failed: {message}"
 
 
 def safe_parse_json(text: str) -> Tuple[bool, Optional[Any], Optional[str]]:
@@ -133,7 +341,12 @@ def safe_parse_json(text: str) -> Tuple[bool, Optional[Any], Optional[str]]:
     except json.JSONDecodeError:
         pass
 
-    # Try extraction
+    # Try embedded valid JSON — raw_decode already parsed it, no re-parse needed
+    found = _raw_decode_first(text)
+    if found:
+        return True, found[0], None
+
+    # Try extraction (code blocks, balanced-but-malformed regions)
     extracted = extract_json(text)
     if extracted:
         try:
@@ -163,17 +376,70 @@ def safe_parse_json(text: str) -> Tuple[bool, Optional[Any], Optional[str]]:
     return False, None, "Unable to extract or parse JSON from text"
 
 
+async def safe_parse_json_async(text: str) -> Tuple[bool, Optional[Any], Optional[str]]:
+    """
+    Async variant of safe_parse_json for use inside event loops.
+
+    Large payloads are CPU-bound and would block the event loop, so they are
+    dispatched to a worker thread. Small inputs are parsed inline since the
+    thread-switch cost would exceed the parse cost.
+
+    Args:
+        text: Text containing or being JSON
+
+    Returns:
+        Tuple of (success: bool, data: Any | None, error: str | None)
+    """
+    if len(text) < _ASYNC_THRESHOLD:
+        return safe_parse_json(text)
+    return await asyncio.to_thread(safe_parse_json, text)
+
+
+async def repair_json_async(text: str) -> Tuple[bool, Optional[str], Optional[str]]:
+    """
+    Async variant of repair_json; offloads large inputs to a worker thread.
+
+    Args:
+        text: Potentially malformed JSON string
+
+    Returns:
+        Tuple of (success: bool, repaired_json: str | None, error: str | None)
+    """
+    if len(text) < _ASYNC_THRESHOLD:
+        return repair_json(text)
+    return await asyncio.to_thread(repair_json, text)
+
+
+# Keyed on the order-preserving dump so schemas with equal content but
+# different key order get their own entries — prompts must reflect the
+# caller's insertion order, not a first-seen collision
+_SCHEMA_FORMAT_CACHE: Dict[str, str] = {}
+_SCHEMA_FORMAT_CACHE_MAX = 128
+
+
 def format_schema_for_prompt(schema: Dict[str, Any]) -> str:
     """
     Format a JSON schema nicely for inclusion in prompts.
 
+    Repeat calls with the same schema hit a cache instead of re-formatting.
+
     Args:
         schema: JSON schema dict
 
     Returns:
         Formatted string representation
     """
-    return json.dumps(schema, indent=2)
+    key = json.dumps(schema)
+    cached = _SCHEMA_FORMAT_CACHE.get(key)
+    if cached is None:
+        if orjson is not None:
+            cached = orjson.dumps(schema, option=orjson.OPT_INDENT_2).decode()
+        else:
+            cached = json.dumps(schema, indent=2)
+        if len(_SCHEMA_FORMAT_CACHE) >= _SCHEMA_FORMAT_CACHE_MAX:
+            _SCHEMA_FORMAT_CACHE.clear()
+        _SCHEMA_FORMAT_CACHE[key] = cached
+    return cached
 
 
 def create_simple_schema(
@@ -208,10 +474,14 @@ def create_simple_schema(
     return schema
 
 
+@lru_cache(maxsize=128)
 def pydantic_to_json_schema(pydantic_model) -> dict:
     """
     Convert a Pydantic model to JSON schema.
 
+    Schema generation is deterministic per class and Pydantic does not
+    memoize it, so results are cached keyed on the model class.
+
     Args:
         pydantic_model: A Pydantic BaseModel class (not instance)
 
@@ -9,25 +9,129 @@ Supports:
 - Comprehensive error handling
 """
 
+import asyncio
+import re
+import threading
 import time
 import random
-from typing import Literal, Optional, Any, Dict, List
-from openai import OpenAI, OpenAIError
-from google import genai
-from google.genai import types
-from groq import Groq
-from dotenv import load_dotenv
+import httpx
+from typing import Iterator, Literal, Optional, Any, Dict, List
 import os
 
 from .token_utils import (
-    count_messages_tokens,
     reconcile_usage,
-    fit_within_context,
+    plan_call,
 )
 from .router import get_context_window
 
-# Load environment variables
-load_dotenv()
+# Environment loading is deferred to first client construction — importing
+# this module should not touch the filesystem
+_ENV_LOADED = False
+
+
+def _load_env() -> None:
+    """Load .env variables once, on first client construction."""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _ENV_LOADED = True
+
+# Shared HTTP connection pools: each OpenAI/Groq SDK client otherwise builds
+# its own httpx.Client, paying fresh DNS + TCP + TLS handshakes per
+# LLMClient instance. One pool per (provider, sync/async) amortizes all that
+# and, with HTTP/2, multiplexes concurrent requests over one connection.
+_HTTPX_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+_HTTPX_TIMEOUT = httpx.Timeout(60.0, connect=5.0)
+
+_SHARED_HTTP_CLIENTS: Dict[tuple, Any] = {}
+_SHARED_HTTP_LOCK = threading.Lock()
+
+
+def _get_shared_http_client(provider: str, use_async: bool = False):
+    """Get (or lazily create) the shared httpx client for a provider."""
+    key = (provider, use_async)
+    with _SHARED_HTTP_LOCK:
+        if key not in _SHARED_HTTP_CLIENTS:
+            client_cls = httpx.AsyncClient if use_async else httpx.Client
+            try:
+                client = client_cls(
+                    http2=True, limits=_HTTPX_LIMITS, timeout=_HTTPX_TIMEOUT
+                )
+            except ImportError:
+                # http2 needs the optional h2 package; HTTP/1.1 pooling
+                # still saves the per-instance handshakes
+                client = client_cls(limits=_HTTPX_LIMITS, timeout=_HTTPX_TIMEOUT)
+            _SHARED_HTTP_CLIENTS[key] = client
+        return _SHARED_HTTP_CLIENTS[key]
+
+
+# Provider SDKs are imported lazily: each pulls in heavy transitive deps
+# (pydantic, grpc, protobuf), costing hundreds of ms at import even when
+# only one provider is ever used. _get_sdk imports on first construction
+# and caches the module here.
+_SDK_CACHE: Dict[str, Any] = {}
+
+# Local aliases so the Gemini message-conversion loop skips repeated
+# attribute lookups on the types module; bound when the google SDK loads
+_GeminiContent: Any = None
+_gemini_text_part: Any = None
+
+# SDK exception classes that are always worth retrying — checked before any
+# string matching since isinstance is both faster and more reliable.
+# Extended as each provider SDK is imported.
+_RETRYABLE_EXC_TYPES: tuple = ()
+_RETRYABLE_EXC_NAMES = (
+    "RateLimitError",
+    "APITimeoutError",
+    "InternalServerError",
+    "APIConnectionError",
+)
+
+
+def _get_sdk(provider: str):
+    """Import and cache the SDK module for a provider on first use."""
+    global _RETRYABLE_EXC_TYPES, _GeminiContent, _gemini_text_part
+
+    sdk = _SDK_CACHE.get(provider)
+    if sdk is not None:
+        return sdk
+
+    if provider == "openai":
+        import openai
+        sdk = openai
+        _RETRYABLE_EXC_TYPES += tuple(
+            getattr(openai, name) for name in _RETRYABLE_EXC_NAMES
+        )
+    elif provider == "google":
+        from google import genai
+        from google.genai import types
+        sdk = genai
+        _SDK_CACHE["google_types"] = types
+        _GeminiContent = types.Content
+        _gemini_text_part = types.Part.from_text
+    elif provider == "groq":
+        import groq
+        sdk = groq
+        _RETRYABLE_EXC_TYPES += tuple(
+            getattr(groq, name) for name in _RETRYABLE_EXC_NAMES
+        )
+    else:
+        raise ValueError(f"Unsupported provider: {provider}")
+
+    _SDK_CACHE[provider] = sdk
+    return sdk
+
+# Single-pass fallback for errors that only surface as message text:
+# rate limits (429), server errors (5xx), timeouts, context overflow
+_RETRYABLE_ERROR_RE = re.compile(
+    r"429|rate limit|5(?:00|02|03|04)|server error|timed?\s?out"
+    r"|context.{0,40}(?:length|too long)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Placeholder counts for calls that skip pre-call estimation; never mutated
+_EMPTY_COUNTS = {"input_tokens": 0, "context_tokens": 0, "estimated_total": 0}
 
 
 class LLMClient:
@@ -49,6 +153,7 @@ class LLMClient:
         backoff_base: Optional[float] = None,
         backoff_jitter: Optional[float] = None,
         hard_prompt_cap: Optional[int] = None,
+        estimate_tokens: bool = False,
     ):
         """
         Initialize LLM client.
@@ -60,73 +165,202 @@ class LLMClient:
             backoff_base: Base backoff time in seconds (None = use config default)
             backoff_jitter: Random jitter factor (None = use config default)
             hard_prompt_cap: Optional hard limit on prompt tokens (triggers summarization)
+            estimate_tokens: Run pre-call token estimation even without a cap
+                (the provider's usage fields cover most needs for free)
         """
-        from .config_loader import get_max_retries, get_backoff_base, get_backoff_jitter
-        
+        from .config_loader import get_config, get_max_retries, get_backoff_base, get_backoff_jitter
+        from .rate_limiter import get_shared_bucket
+
         self.provider = provider
         self.model = model
         self.max_retries = max_retries if max_retries is not None else get_max_retries()
         self.backoff_base = backoff_base if backoff_base is not None else get_backoff_base()
         self.backoff_jitter = backoff_jitter if backoff_jitter is not None else get_backoff_jitter()
         self.hard_prompt_cap = hard_prompt_cap
+        self.estimate_tokens = estimate_tokens
+
+        # Proactive rate limiting: shared per-provider buckets pace requests
+        # and tokens to configured quotas instead of retrying after 429s
+        config = get_config()
+        self._rpm_bucket = get_shared_bucket(
+            provider, "rpm", config.get(f"rate_limits.{provider}.rpm")
+        )
+        self._tpm_bucket = get_shared_bucket(
+            provider, "tpm", config.get(f"rate_limits.{provider}.tpm")
+        )
+
+        # Memoized Gemini GenerateContentConfig objects, keyed by parameters
+        # (callers usually reuse the same temperature/max_tokens every call)
+        self._google_config_cache: Dict[tuple, Any] = {}
+
+        # Bound once so retries skip the module-attribute lookup
+        self._rand = random.random
+
+        # Usage from the last stream_chat call (None until one completes)
+        self.last_stream_usage: Optional[Dict[str, Any]] = None
+
+        # Optional exact-match response cache for deterministic calls
+        self._response_cache = None
+        if config.get("development.cache_responses", False):
+            from .response_cache import get_default_cache
+            self._response_cache = get_default_cache()
 
         # Initialize provider client
         self._init_client()
 
     def _init_client(self) -> None:
-        """Initialize provider-specific client."""
+        """Initialize provider-specific sync and async clients."""
+        _load_env()
+        sdk = _get_sdk(self.provider)
+
         if self.provider == "openai":
             api_key = os.getenv("OPENAI_API_KEY")
             if not api_key:
                 raise ValueError("OPENAI_API_KEY not found in environment")
-            self.client = OpenAI(
+            self.client = sdk.OpenAI(
                                 api_key=api_key,
+                                http_client=_get_shared_http_client("openai"),
                                 )
+            self.aclient = sdk.AsyncOpenAI(
+                api_key=api_key,
+                http_client=_get_shared_http_client("openai", use_async=True),
+            )
 
         elif self.provider == "google":
             api_key = os.getenv("GEMINI_API_KEY")
             if not api_key:
                 raise ValueError("GEMINI_API_KEY not found in environment")
-            self.client = genai.Client(api_key=api_key)
+            # google-genai manages its own transport and doesn't accept an
+            # external httpx client; it already pools within the instance
+            self.client = sdk.Client(api_key=api_key)
+            # google-genai exposes async calls on the same client via .aio
+            self.aclient = self.client.aio
 
         elif self.provider == "groq":
             api_key = os.getenv("GROQ_API_KEY")
             if not api_key:
                 raise ValueError("GROQ_API_KEY not found in environment")
-            self.client = Groq(
+            self.client = sdk.Groq(
                                api_key=api_key,
                                #model = self.model
+                               http_client=_get_shared_http_client("groq"),
                                )
+            self.aclient = sdk.AsyncGroq(
+                api_key=api_key,
+                http_client=_get_shared_http_client("groq", use_async=True),
+            )
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
     def _calculate_backoff(self, attempt: int) -> float:
         """Calculate exponential backoff with jitter."""
-        base_wait = self.backoff_base * (2 ** attempt)
-        jitter = random.uniform(0, self.backoff_jitter * base_wait)
-        return base_wait + jitter
+        # Bit-shift doubling, capped so a pathological attempt count can't
+        # produce an hours-long sleep; jitter folded into one multiply
+        base_wait = self.backoff_base * (1 << min(attempt, 10))
+        return base_wait * (1.0 + self.backoff_jitter * self._rand())
 
-    def _is_retryable_error(self, error: Exception) -> bool:
-        """Check if error is transient and should be retried."""
-        error_str = str(error).lower()
+    @staticmethod
+    def _server_retry_hint(error: Exception) -> Optional[float]:
+        """
+        Extract the server's Retry-After hint from an SDK exception, if any.
 
-        # Rate limits (429)
-        if "429" in error_str or "rate limit" in error_str:
-            return True
+        OpenAI/Groq 429 responses carry a Retry-After header (seconds or
+        HTTP-date); honoring it converges on the server's actual quota
+        window instead of blindly doubling past it.
+        """
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            return None
+
+        retry_after = headers.get("retry-after")
+        if not retry_after:
+            return None
+
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
 
-        # Server errors (5xx)
-        if any(x in error_str for x in ["500", "502", "503", "504", "server error"]):
-            return True
+        # HTTP-date form
+        try:
+            from email.utils import parsedate_to_datetime
+            from datetime import datetime, timezone
+
+            target = parsedate_to_datetime(retry_after)
+            return max(0.0, (target - datetime.now(timezone.utc)).total_seconds())
+        except (ValueError, TypeError):
+            return None
+
+    def _backoff_seconds(self, attempt: int, error: Exception) -> float:
+        """Backoff duration for a retry, preferring the server's hint."""
+        backoff_sec = self._calculate_backoff(attempt)
+        hint = self._server_retry_hint(error)
+        if hint is not None:
+            backoff_sec = max(hint, backoff_sec)
+        return backoff_sec
+
+    def _cache_key_for(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        kwargs: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Cache key for this request, or None when it isn't cacheable.
 
-        # Timeouts
-        if "timeout" in error_str or "timed out" in error_str:
-            return True
+        Only deterministic (temperature=0) calls are cached — sampled
+        outputs must not be replayed. Tool calls are never cached: a hit
+        returns text only (raw=None), which would drop tool_calls.
+        """
+        if self._response_cache is None:
+            return None
+        if temperature is None or float(temperature) != 0.0:
+            return None
+        if kwargs.get("tools"):
+            return None
+
+        from .response_cache import ResponseCache
+        return ResponseCache.make_key(
+            self.model, messages, temperature, max_tokens, kwargs
+        )
+
+    @staticmethod
+    def _cache_hit_result(text: str) -> Dict[str, Any]:
+        """Build a chat()-shaped result for a cache hit."""
+        return {
+            "text": text,
+            "usage": reconcile_usage({}),
+            "latency_ms": 0,
+            "raw": None,
+            "meta": {
+                "retry_count": 0,
+                "backoff_ms_total": 0,
+                "overflow_handled": False,
+                "cache_hit": "exact",
+            },
+        }
+
+    def _needs_estimate(self) -> bool:
+        """
+        Whether pre-call tokenization is worth running.
 
-        # Context overflow (may be handled differently)
-        if "context" in error_str and ("length" in error_str or "too long" in error_str):
+        Needed when a hard cap must be enforced, a TPM bucket must be fed
+        a cost, or the caller opted in via estimate_tokens.
+        """
+        return bool(
+            self.hard_prompt_cap
+            or self.estimate_tokens
+            or self._tpm_bucket is not None
+        )
+
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """Check if error is transient and should be retried."""
+        if isinstance(error, _RETRYABLE_EXC_TYPES):
             return True
 
-        return False
+        return bool(_RETRYABLE_ERROR_RE.search(str(error)))
 
     def chat(
         self,
@@ -149,28 +383,34 @@ class LLMClient:
         Returns:
             Dict with text, usage (estimated + actual), latency_ms, meta
         """
-        # Pre-call token estimation
-        token_counts = count_messages_tokens(
-            messages, self.provider, self.model, context_strs
-        )
-
-        # Check hard prompt cap
+        # Deterministic calls may be served straight from the cache
+        cache_key = self._cache_key_for(messages, temperature, max_tokens, kwargs)
+        if cache_key is not None:
+            cached_text = self._response_cache.get(cache_key)
+            if cached_text is not None:
+                return self._cache_hit_result(cached_text)
+
+        # Fused pre-call planning: count, fit within the hard cap, and
+        # recount in one tokenization pass. Skipped entirely when nothing
+        # consumes the estimate — the provider's usage fields are free.
         overflow_handled = False
-        if self.hard_prompt_cap and token_counts["estimated_total"] > self.hard_prompt_cap:
-            # Apply context-fit strategy
-            messages, context_strs, fit_meta = fit_within_context(
+        if self._needs_estimate():
+            messages, context_strs, token_counts, fit_meta = plan_call(
                 messages,
                 self.provider,
                 self.model,
-                self.hard_prompt_cap,
-                strategy="truncate",
+                hard_cap=self.hard_prompt_cap,
                 context_strs=context_strs,
             )
             overflow_handled = fit_meta.get("overflow", False)
-            # Recalculate after fitting
-            token_counts = count_messages_tokens(
-                messages, self.provider, self.model, context_strs
-            )
+        else:
+            token_counts = _EMPTY_COUNTS
+
+        # Admission control: wait for quota before hitting the provider
+        if self._rpm_bucket is not None:
+            self._rpm_bucket.acquire(1)
+        if self._tpm_bucket is not None:
+            self._tpm_bucket.acquire(token_counts["estimated_total"])
 
         # Retry loop
         retry_count = 0
@@ -200,6 +440,9 @@ class LLMClient:
                 # Reconcile token usage
                 usage = reconcile_usage(token_counts, provider_usage)
 
+                if cache_key is not None:
+                    self._response_cache.set(cache_key, text)
+
                 return {
                     "text": text,
                     "usage": usage,
@@ -218,7 +461,7 @@ class LLMClient:
                 # Check if we should retry
                 if attempt < self.max_retries and self._is_retryable_error(e):
                     retry_count += 1
-                    backoff_sec = self._calculate_backoff(attempt)
+                    backoff_sec = self._backoff_seconds(attempt, e)
                     backoff_ms = int(backoff_sec * 1000)
                     total_backoff_ms += backoff_ms
 
@@ -243,14 +486,255 @@ class LLMClient:
         # Should not reach here, but just in case
         raise last_error or Exception("Unknown error in LLM call")
 
-    def _call_openai(
+    async def achat(
+        self,
+        messages: List[Dict[str, str]],
+        context_strs: Optional[List[str]] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Async variant of chat() for concurrent multi-request workloads.
+
+        Same retry/token-management behavior as chat(), but awaits the
+        provider call and backs off with asyncio.sleep so the event loop
+        stays free to overlap other requests.
+
+        Args:
+            messages: OpenAI-style messages array
+            context_strs: Optional context strings (counted separately)
+            temperature: Sampling temperature
+            max_tokens: Max completion tokens
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Dict with text, usage (estimated + actual), latency_ms, meta
+        """
+        # Deterministic calls may be served straight from the cache
+        cache_key = self._cache_key_for(messages, temperature, max_tokens, kwargs)
+        if cache_key is not None:
+            cached_text = self._response_cache.get(cache_key)
+            if cached_text is not None:
+                return self._cache_hit_result(cached_text)
+
+        # Fused pre-call planning: count, fit within the hard cap, and
+        # recount in one tokenization pass. Skipped entirely when nothing
+        # consumes the estimate — the provider's usage fields are free.
+        overflow_handled = False
+        if self._needs_estimate():
+            messages, context_strs, token_counts, fit_meta = plan_call(
+                messages,
+                self.provider,
+                self.model,
+                hard_cap=self.hard_prompt_cap,
+                context_strs=context_strs,
+            )
+            overflow_handled = fit_meta.get("overflow", False)
+        else:
+            token_counts = _EMPTY_COUNTS
+
+        # Admission control: await quota without blocking the event loop
+        if self._rpm_bucket is not None:
+            await self._rpm_bucket.aacquire(1)
+        if self._tpm_bucket is not None:
+            await self._tpm_bucket.aacquire(token_counts["estimated_total"])
+
+        # Retry loop
+        retry_count = 0
+        total_backoff_ms = 0
+        last_error = None
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                start_time = time.time()
+
+                if self.provider == "openai":
+                    response = await self._acall_openai(messages, temperature, max_tokens, **kwargs)
+                elif self.provider == "google":
+                    response = await self._acall_google(messages, temperature, max_tokens, **kwargs)
+                elif self.provider == "groq":
+                    response = await self._acall_groq(messages, temperature, max_tokens, **kwargs)
+                else:
+                    raise ValueError(f"Unsupported provider: {self.provider}")
+
+                latency_ms = int((time.time() - start_time) * 1000)
+
+                text = response["text"]
+                provider_usage = response.get("usage")
+                usage = reconcile_usage(token_counts, provider_usage)
+
+                if cache_key is not None:
+                    self._response_cache.set(cache_key, text)
+
+                return {
+                    "text": text,
+                    "usage": usage,
+                    "latency_ms": latency_ms,
+                    "raw": response.get("raw"),
+                    "meta": {
+                        "retry_count": retry_count,
+                        "backoff_ms_total": total_backoff_ms,
+                        "overflow_handled": overflow_handled,
+                    },
+                }
+
+            except Exception as e:
+                last_error = e
+
+                if attempt < self.max_retries and self._is_retryable_error(e):
+                    retry_count += 1
+                    backoff_sec = self._backoff_seconds(attempt, e)
+                    backoff_ms = int(backoff_sec * 1000)
+                    total_backoff_ms += backoff_ms
+
+                    await asyncio.sleep(backoff_sec)
+                    continue
+
+                error_str = str(e).lower()
+                if (
+                    "context" in error_str
+                    and ("length" in error_str or "too long" in error_str)
+                    and not overflow_handled
+                ):
+                    raise ValueError(
+                        "Context window exceeded. Use overflow_summarize.v1 prompt."
+                    ) from e
+
+                raise
+
+        raise last_error or Exception("Unknown error in LLM call")
+
+    def _create_with_retry(self, factory):
+        """Run a provider-call factory with the standard retry/backoff loop."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                return factory()
+            except Exception as e:
+                if attempt < self.max_retries and self._is_retryable_error(e):
+                    time.sleep(self._backoff_seconds(attempt, e))
+                    continue
+                raise
+
+    def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        **kwargs,
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion, yielding text chunks as they arrive.
+
+        Hides time-to-last-token behind caller processing: downstream
+        display/parsing overlaps model decoding, and iteration can stop
+        early to abandon a response without paying for the rest.
+
+        Retries wrap stream creation only — once tokens flow, errors
+        propagate to the consumer.
+
+        Authoritative usage is requested from the provider (terminal chunk
+        via stream_options on OpenAI/Groq) and stored on
+        self.last_stream_usage after the stream is exhausted — no
+        client-side token estimation is run on this path.
+
+        Args:
+            messages: OpenAI-style messages array
+            temperature: Sampling temperature
+            max_tokens: Max completion tokens
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            Completion text fragments in arrival order
+        """
+        self.last_stream_usage = None
+
+        if self.provider in ("openai", "groq"):
+            if self.provider == "openai":
+                params = self._build_openai_params(messages, temperature, max_tokens, **kwargs)
+                client = self.client
+            else:
+                params = self._build_groq_params(messages, temperature, max_tokens, **kwargs)
+                client = self.client
+            params["stream"] = True
+            # Ask for the terminal usage chunk — authoritative counts from
+            # the provider, so the streaming path never touches tiktoken
+            params["stream_options"] = {"include_usage": True}
+
+            stream = self._create_with_retry(
+                lambda: client.chat.completions.create(**params)
+            )
+            for chunk in stream:
+                usage = getattr(chunk, "usage", None)
+                if usage is not None:
+                    self.last_stream_usage = {
+                        "prompt_tokens": usage.prompt_tokens,
+                        "completion_tokens": usage.completion_tokens,
+                        "total_tokens": usage.total_tokens,
+                    }
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+
+        elif self.provider == "google":
+            gemini_contents, generation_config = self._build_google_request(
+                messages, temperature, max_tokens
+            )
+            stream = self._create_with_retry(
+                lambda: self.client.models.generate_content_stream(
+                    model=self.model,
+                    contents=gemini_contents,
+                    config=generation_config,
+                )
+            )
+            for chunk in stream:
+                usage_meta = getattr(chunk, "usage_metadata", None)
+                if usage_meta is not None:
+                    self.last_stream_usage = {
+                        "promptTokenCount": usage_meta.prompt_token_count,
+                        "candidatesTokenCount": usage_meta.candidates_token_count,
+                    }
+                if chunk.text:
+                    yield chunk.text
+
+        else:
+            raise ValueError(f"Unsupported provider: {self.provider}")
+
+    async def batch_chat(
+        self,
+        batch: List[List[Dict[str, str]]],
+        max_concurrency: int = 10,
+        **kwargs,
+    ) -> List[Dict[str, Any]]:
+        """
+        Send many chat requests concurrently with bounded parallelism.
+
+        Overlaps network + server latency across requests — near-linear
+        throughput gains for I/O-bound batches.
+
+        Args:
+            batch: List of messages arrays, one per request
+            max_concurrency: Max in-flight requests at once
+            **kwargs: Forwarded to achat() for every request
+
+        Returns:
+            List of achat() result dicts in input order
+        """
+        sem = asyncio.Semaphore(max_concurrency)
+
+        async def _bounded(messages: List[Dict[str, str]]) -> Dict[str, Any]:
+            async with sem:
+                return await self.achat(messages, **kwargs)
+
+        return await asyncio.gather(*(_bounded(m) for m in batch))
+
+    def _build_openai_params(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
         **kwargs,
     ) -> Dict[str, Any]:
-        """Call OpenAI API."""
+        """Build OpenAI chat.completions parameters."""
         params = {
             "model": self.model,
             "messages": messages,
@@ -264,7 +748,7 @@ class LLMClient:
         # Reasoning models don't support temperature parameter
         if temperature is not None and not is_reasoning_model:
             params["temperature"] = temperature
-        
+
         if max_tokens is not None:
             # Reasoning models use max_completion_tokens instead of max_tokens
             if is_reasoning_model:
@@ -273,9 +757,32 @@ class LLMClient:
                 params["max_tokens"] = max_tokens
 
         params.update(kwargs)
+        return params
 
-        response = self.client.chat.completions.create(**params)
+    def _build_groq_params(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Build Groq chat.completions parameters (OpenAI-compatible)."""
+        params = {
+            "model": self.model,
+            "messages": messages,
+        }
+
+        if temperature is not None:
+            params["temperature"] = temperature
+        if max_tokens is not None:
+            params["max_tokens"] = max_tokens
 
+        params.update(kwargs)
+        return params
+
+    @staticmethod
+    def _extract_chat_response(response) -> Dict[str, Any]:
+        """Extract text + usage from an OpenAI-style completions response."""
         return {
             "text": response.choices[0].message.content or "",
             "usage": {
@@ -286,52 +793,51 @@ class LLMClient:
             "raw": response,
         }
 
-    def _call_google(
+    def _build_google_request(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
-        **kwargs,
-    ) -> Dict[str, Any]:
-        """Call Google Gemini API using new google-genai SDK."""
-        # Convert OpenAI format to Gemini format
-        gemini_contents = []
-        system_instruction = None
-
-        for msg in messages:
-            role = msg["role"]
-            content = msg["content"]
-
-            if role == "system":
-                system_instruction = content
-            elif role == "user":
-                gemini_contents.append(
-                    types.Content(role="user", parts=[types.Part.from_text(text=content)])
-                )
-            elif role == "assistant":
-                gemini_contents.append(
-                    types.Content(role="model", parts=[types.Part.from_text(text=content)])
-                )
-
-        # Build generation config
-        config_params = {}
-        if temperature is not None:
-            config_params["temperature"] = temperature
-        if max_tokens is not None:
-            config_params["max_output_tokens"] = max_tokens
-        if system_instruction:
-            config_params["system_instruction"] = system_instruction
-
-        generation_config = types.GenerateContentConfig(**config_params) if config_params else None
-
-        # Generate content using new client API
-        response = self.client.models.generate_content(
-            model=self.model,
-            contents=gemini_contents,
-            config=generation_config,
+    ):
+        """Convert OpenAI-style messages to Gemini contents + config."""
+        system_instruction = next(
+            (m["content"] for m in messages if m["role"] == "system"), None
         )
+        gemini_contents = [
+            _GeminiContent(
+                role="model" if m["role"] == "assistant" else "user",
+                parts=[_gemini_text_part(text=m["content"])],
+            )
+            for m in messages
+            if m["role"] != "system"
+        ]
+
+        # Reuse the generation config when parameters are unchanged —
+        # rebuilding it per call is pure allocation overhead
+        config_key = (temperature, max_tokens, system_instruction)
+        generation_config = self._google_config_cache.get(config_key)
+
+        if generation_config is None and any(v is not None for v in config_key):
+            config_params = {}
+            if temperature is not None:
+                config_params["temperature"] = temperature
+            if max_tokens is not None:
+                config_params["max_output_tokens"] = max_tokens
+            if system_instruction:
+                config_params["system_instruction"] = system_instruction
+
+            generation_config = _SDK_CACHE["google_types"].GenerateContentConfig(
+                **config_params
+            )
+            if len(self._google_config_cache) > 32:
+                self._google_config_cache.clear()
+            self._google_config_cache[config_key] = generation_config
+
+        return gemini_contents, generation_config
 
-        # Extract usage metadata
+    @staticmethod
+    def _extract_google_response(response) -> Dict[str, Any]:
+        """Extract text + usage metadata from a Gemini response."""
         usage = {}
         if hasattr(response, "usage_metadata") and response.usage_metadata:
             usage = {
@@ -345,37 +851,94 @@ class LLMClient:
             "raw": response,
         }
 
-    def _call_groq(
+    def _call_openai(
         self,
         messages: List[Dict[str, str]],
         temperature: Optional[float],
         max_tokens: Optional[int],
         **kwargs,
     ) -> Dict[str, Any]:
-        """Call Groq API (OpenAI-compatible)."""
-        params = {
-            "model": self.model,
-            "messages": messages,
-        }
+        """Call OpenAI API."""
+        params = self._build_openai_params(messages, temperature, max_tokens, **kwargs)
+        response = self.client.chat.completions.create(**params)
+        return self._extract_chat_response(response)
 
-        if temperature is not None:
-            params["temperature"] = temperature
-        if max_tokens is not None:
-            params["max_tokens"] = max_tokens
+    async def _acall_openai(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call OpenAI API asynchronously."""
+        params = self._build_openai_params(messages, temperature, max_tokens, **kwargs)
+        response = await self.aclient.chat.completions.create(**params)
+        return self._extract_chat_response(response)
 
-        params.update(kwargs)
+    def _call_google(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Google Gemini API using new google-genai SDK."""
+        gemini_contents, generation_config = self._build_google_request(
+            messages, temperature, max_tokens
+        )
+
+        # Generate content using new client API
+        response = self.client.models.generate_content(
+            model=self.model,
+            contents=gemini_contents,
+            config=generation_config,
+        )
 
+        return self._extract_google_response(response)
+
+    async def _acall_google(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Google Gemini API asynchronously via client.aio."""
+        gemini_contents, generation_config = self._build_google_request(
+            messages, temperature, max_tokens
+        )
+
+        response = await self.aclient.models.generate_content(
+            model=self.model,
+            contents=gemini_contents,
+            config=generation_config,
+        )
+
+        return self._extract_google_response(response)
+
+    def _call_groq(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Groq API (OpenAI-compatible)."""
+        params = self._build_groq_params(messages, temperature, max_tokens, **kwargs)
         response = self.client.chat.completions.create(**params)
+        return self._extract_chat_response(response)
 
-        return {
-            "text": response.choices[0].message.content or "",
-            "usage": {
-                "prompt_tokens": response.usage.prompt_tokens if response.usage else None,
-                "completion_tokens": response.usage.completion_tokens if response.usage else None,
-                "total_tokens": response.usage.total_tokens if response.usage else None,
-            },
-            "raw": response,
-        }
+    async def _acall_groq(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """Call Groq API asynchronously (OpenAI-compatible)."""
+        params = self._build_groq_params(messages, temperature, max_tokens, **kwargs)
+        response = await self.aclient.chat.completions.create(**params)
+        return self._extract_chat_response(response)
 
     def json_chat(
         self,
@@ -8,8 +8,11 @@ Logs each LLM call to logs/runs.csv with:
 - Cost estimates (with disclaimer)
 """
 
+import atexit
 import csv
 import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
@@ -35,24 +38,107 @@ COST_PER_1M_TOKENS = {
     },
 }
 
+# Flattened per-token rates, pre-divided by 1M so estimate_cost is a single
+# dict lookup + two multiplies. Longest prefixes first so the most specific
+# model name wins on partial matches.
+_FLAT_COSTS: dict[tuple[str, str], tuple[float, float]] = {
+    (provider, model): (rates["input"] / 1e6, rates["output"] / 1e6)
+    for provider, models in COST_PER_1M_TOKENS.items()
+    for model, rates in models.items()
+}
+_PREFIX_COSTS: list[tuple[str, str, tuple[float, float]]] = sorted(
+    ((provider, model, rates) for (provider, model), rates in _FLAT_COSTS.items()),
+    key=lambda item: len(item[1]),
+    reverse=True,
+)
+
+
+# Buffered writer state: rows are appended in memory and flushed in batches,
+# so the per-call cost is a list.append instead of open/write/close syscalls
+_LOG_FH = None
+_LOG_WRITER = None
+_LOG_LOCK = threading.Lock()
+_BUFFER: list[list[Any]] = []
+_FLUSH_EVERY = 32
+
+
+def _flush_buffer_locked() -> None:
+    """Write buffered rows to disk. Caller must hold _LOG_LOCK."""
+    if _BUFFER and _LOG_WRITER is not None:
+        _LOG_WRITER.writerows(_BUFFER)
+        _BUFFER.clear()
+        _LOG_FH.flush()
+
+
+def flush_logs() -> None:
+    """Flush any buffered log rows to disk."""
+    with _LOG_LOCK:
+        _flush_buffer_locked()
+
+
+def _close_log() -> None:
+    """Flush and close the log file handle (registered atexit)."""
+    global _LOG_FH, _LOG_WRITER
+    with _LOG_LOCK:
+        _flush_buffer_locked()
+        if _LOG_FH is not None:
+            _LOG_FH.close()
+            _LOG_FH = None
+            _LOG_WRITER = None
+
+
+atexit.register(_close_log)
+
+
+# Second-resolution timestamp cache: datetime.isoformat string formatting
+# dominates timestamp cost, so reformat only when the second ticks over
+_TS_CACHE: tuple[int, str] = (0, "")
+
+
+def _format_timestamp() -> str:
+    """ISO timestamp with microseconds, reusing the cached seconds prefix."""
+    global _TS_CACHE
+    now = time.time()
+    floor = int(now)
+    if floor != _TS_CACHE[0]:
+        _TS_CACHE = (floor, datetime.fromtimestamp(floor).isoformat(timespec="seconds"))
+    return f"{_TS_CACHE[1]}.{int((now - floor) * 1e6):06d}"
+
+
+# Resolved-path + header-initialization caches: the .exists()/mkdir/stat
+# syscalls only need to happen once per process, not per log call
+_LOG_PATH_CACHE: Optional[Path] = None
+_CSV_INITIALIZED = False
+
 
 def _get_log_path() -> Path:
     """Get path to logs/runs.csv, creating directory if needed."""
+    global _LOG_PATH_CACHE
+
+    if _LOG_PATH_CACHE is not None:
+        return _LOG_PATH_CACHE
+
     # Try current directory first
     log_dir = Path("logs")
-    
+
     # If logs doesn't exist in current dir, try relative to project root
     if not log_dir.exists():
         utils_dir = Path(__file__).parent
         project_root = utils_dir.parent
         log_dir = project_root / "logs"
-    
+
     log_dir.mkdir(exist_ok=True)
-    return log_dir / "runs.csv"
+    _LOG_PATH_CACHE = log_dir / "runs.csv"
+    return _LOG_PATH_CACHE
 
 
 def _init_csv_if_needed(log_path: Path) -> None:
     """Initialize CSV with headers if file doesn't exist."""
+    global _CSV_INITIALIZED
+
+    if _CSV_INITIALIZED:
+        return
+
     if not log_path.exists():
         with open(log_path, "w", newline="") as f:
             writer = csv.writer(f)
@@ -75,6 +161,8 @@ def _init_csv_if_needed(log_path: Path) -> None:
                 "notes",
             ])
 
+    _CSV_INITIALIZED = True
+
 
 def estimate_cost(
     provider: str,
@@ -100,26 +188,20 @@ def estimate_cost(
     if not prompt_tokens or not completion_tokens:
         return None
 
-    provider_pricing = COST_PER_1M_TOKENS.get(provider, {})
-    model_pricing = None
-
     # Try exact match first
-    if model in provider_pricing:
-        model_pricing = provider_pricing[model]
-    else:
+    rates = _FLAT_COSTS.get((provider, model))
+
+    if rates is None:
         # Try partial match (e.g., "gpt-4o-mini-2024-07-18" matches "gpt-4o-mini")
-        for key in provider_pricing:
-            if key in model:
-                model_pricing = provider_pricing[key]
+        for known_provider, known_model, known_rates in _PREFIX_COSTS:
+            if known_provider == provider and known_model in model:
+                rates = known_rates
                 break
 
-    if not model_pricing:
+    if rates is None:
         return None
 
-    input_cost = (prompt_tokens / 1_000_000) * model_pricing["input"]
-    output_cost = (completion_tokens / 1_000_000) * model_pricing["output"]
-
-    return round(input_cost + output_cost, 6)
+    return round(prompt_tokens * rates[0] + completion_tokens * rates[1], 6)
 
 
 def log_llm_call(
@@ -147,8 +229,7 @@ def log_llm_call(
         overflow_handled: Whether context overflow was handled
         notes: Optional notes or error messages
     """
-    log_path = _get_log_path()
-    _init_csv_if_needed(log_path)
+    global _LOG_FH, _LOG_WRITER
 
     # Extract token counts
     input_tokens_est = usage.get("input_tokens_est", 0)
@@ -169,68 +250,103 @@ def log_llm_call(
     # Format cost with disclaimer
     cost_str = f"~${cost_estimate:.6f}" if cost_estimate else "N/A"
 
-    # Append to CSV
-    with open(log_path, "a", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            datetime.now().isoformat(),
-            provider,
-            model,
-            technique,
-            latency_ms,
-            input_tokens_est,
-            context_tokens_est,
-            total_est,
-            prompt_tokens_actual or "",
-            completion_tokens_actual or "",
-            total_tokens_actual or "",
-            retry_count,
-            backoff_ms_total,
-            overflow_handled,
-            cost_str,
-            notes,
-        ])
+    row = [
+        _format_timestamp(),
+        provider,
+        model,
+        technique,
+        latency_ms,
+        input_tokens_est,
+        context_tokens_est,
+        total_est,
+        prompt_tokens_actual or "",
+        completion_tokens_actual or "",
+        total_tokens_actual or "",
+        retry_count,
+        backoff_ms_total,
+        overflow_handled,
+        cost_str,
+        notes,
+    ]
+
+    # Buffer the row; flush in batches to amortize disk I/O
+    with _LOG_LOCK:
+        if _LOG_FH is None:
+            log_path = _get_log_path()
+            _init_csv_if_needed(log_path)
+            _LOG_FH = open(log_path, "a", newline="")
+            _LOG_WRITER = csv.writer(_LOG_FH)
+
+        _BUFFER.append(row)
+        if len(_BUFFER) >= _FLUSH_EVERY:
+            _flush_buffer_locked()
 
 
 def get_log_summary() -> dict[str, Any]:
     """
     Get summary statistics from logs/runs.csv.
 
+    Streams the CSV in a single pass with O(1) memory — no pandas import
+    (~500ms cold) and no full-file DataFrame load.
+
     Returns:
         Dict with total calls, avg latency, total tokens, etc.
     """
+    flush_logs()
     log_path = _get_log_path()
 
     if not log_path.exists():
         return {"total_calls": 0, "message": "No logs found"}
 
-    import pandas as pd
+    from collections import Counter
 
     try:
-        df = pd.read_csv(log_path)
+        total_calls = 0
+        latency_sum = 0
+        total_retries = 0
+        techniques: Counter[str] = Counter()
+        providers: Counter[str] = Counter()
+        prompt_tokens_sum = 0
+        prompt_tokens_seen = False
+        completion_tokens_sum = 0
+        completion_tokens_seen = False
+
+        with open(log_path, newline="") as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                total_calls += 1
+                latency_sum += int(float(row.get("latency_ms") or 0))
+                total_retries += int(float(row.get("retry_count") or 0))
+                techniques[row.get("technique", "")] += 1
+                providers[row.get("provider", "")] += 1
+
+                prompt_actual = row.get("prompt_tokens_actual")
+                if prompt_actual:
+                    prompt_tokens_sum += int(float(prompt_actual))
+                    prompt_tokens_seen = True
+
+                completion_actual = row.get("completion_tokens_actual")
+                if completion_actual:
+                    completion_tokens_sum += int(float(completion_actual))
+                    completion_tokens_seen = True
 
         # Handle empty CSV
-        if len(df) == 0:
+        if total_calls == 0:
             return {"total_calls": 0, "message": "Log file is empty"}
 
         summary = {
-            "total_calls": len(df),
-            "avg_latency_ms": df["latency_ms"].mean(),
-            "total_retries": df["retry_count"].sum(),
-            "techniques_used": df["technique"].value_counts().to_dict(),
-            "providers_used": df["provider"].value_counts().to_dict(),
+            "total_calls": total_calls,
+            "avg_latency_ms": latency_sum / total_calls,
+            "total_retries": total_retries,
+            "techniques_used": dict(techniques),
+            "providers_used": dict(providers),
         }
 
-        # Token statistics (using actual when available, estimated otherwise)
-        if "prompt_tokens_actual" in df.columns:
-            actual_prompts = df["prompt_tokens_actual"].dropna()
-            if len(actual_prompts) > 0:
-                summary["total_prompt_tokens"] = int(actual_prompts.sum())
-
-        if "completion_tokens_actual" in df.columns:
-            actual_completions = df["completion_tokens_actual"].dropna()
-            if len(actual_completions) > 0:
-                summary["total_completion_tokens"] = int(actual_completions.sum())
+        # Token statistics (actual counts, when the provider reported them)
+        if prompt_tokens_seen:
+            summary["total_prompt_tokens"] = prompt_tokens_sum
+        if completion_tokens_seen:
+            summary["total_completion_tokens"] = completion_tokens_sum
 
         return summary
 
@@ -240,6 +356,11 @@ def get_log_summary() -> dict[str, Any]:
 
 def clear_logs() -> None:
     """Delete logs/runs.csv (use with caution)."""
+    global _CSV_INITIALIZED
+    with _LOG_LOCK:
+        _BUFFER.clear()
+    _close_log()
     log_path = _get_log_path()
     if log_path.exists():
-        os.remove(log_path)
\ No newline at end of file
+        os.remove(log_path)
+    _CSV_INITIALIZED = False
\ No newline at end of file
@@ -15,9 +15,80 @@ Usage:
                        format="Plain text paragraph")
 """
 
-from dataclasses import dataclass
-from string import Template
-from typing import Optional, List, Dict, Tuple
+import keyword
+import re
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Callable, Optional, List, Dict, Mapping, Tuple
+
+
+_PLACEHOLDER_RE = re.compile(r"\$\{(\w+)\}")
+
+
+class _SafeDict(dict):
+    """Leave unknown placeholders intact, like Template.safe_substitute."""
+
+    def __missing__(self, key: str) -> str:
+        return "${" + key + "}"
+
+
+def _build_render_fn(template: str) -> Optional[Callable[..., str]]:
+    """
+    Generate a render function that inlines the template as an f-string.
+
+    f-strings compile to FORMAT_VALUE bytecode — the fastest interpolation
+    Python offers, beating both Template.safe_substitute and format_map.
+    Placeholders default to their literal ${var} form so missing variables
+    keep safe_substitute semantics.
+
+    Returns None when a placeholder name can't be a parameter (the caller
+    falls back to format_map rendering).
+    """
+    names = list(dict.fromkeys(_PLACEHOLDER_RE.findall(template)))
+    if any(not name.isidentifier() or keyword.iskeyword(name) for name in names):
+        return None
+
+    # Build the f-string body: literal segments get braces doubled and
+    # quotes/backslashes escaped; placeholders become {name} fields
+    parts = []
+    last = 0
+    for m in _PLACEHOLDER_RE.finditer(template):
+        lit = template[last:m.start()]
+        parts.append(
+            lit.replace("\\", "\\\\").replace('"', '\\"')
+            .replace("{", "{{").replace("}", "}}")
+        )
+        parts.append("{" + m.group(1) + "}")
+        last = m.end()
+    parts.append(
+        template[last:].replace("\\", "\\\\").replace('"', '\\"')
+        .replace("{", "{{").replace("}", "}}")
+    )
+
+    args = ", ".join(f"{name}={'${' + name + '}'!r}" for name in names)
+    source = f'def _render({args}{", " if args else ""}**_extra):\n'
+    source += f'    return f"""{"".join(parts)}"""\n'
+
+    namespace: dict = {}
+    exec(source, namespace)
+    return namespace["_render"]
+
+
+def _to_format_string(template: str) -> str:
+    """
+    Translate a ${var} template into a str.format-style {var} string.
+
+    Literal braces in the template (e.g., JSON examples) are escaped as
+    {{ / }} so format_map leaves them untouched.
+    """
+    parts = []
+    last = 0
+    for m in _PLACEHOLDER_RE.finditer(template):
+        parts.append(template[last:m.start()].replace("{", "{{").replace("}", "}}"))
+        parts.append("{" + m.group(1) + "}")
+        last = m.end()
+    parts.append(template[last:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
 
 
 @dataclass
@@ -40,10 +111,19 @@ class PromptSpec:
     stop: Optional[List[str]] = None
     max_tokens: Optional[int] = None
     temperature: Optional[float] = None
+    # format_map-ready translation of template, filled in at module load.
+    # str.format_map substitutes in C, ~5-10x faster than string.Template's
+    # regex-based safe_substitute on the hot render path.
+    _format_str: Optional[str] = field(default=None, init=False, repr=False)
+    # exec-generated f-string renderer (fastest path); None when codegen
+    # isn't possible for this template, in which case format_map is used
+    _render_fn: Optional[Callable[..., str]] = field(
+        default=None, init=False, repr=False
+    )
 
 
-# Central prompt registry
-PROMPTS: Dict[str, PromptSpec] = {
+# Central prompt registry (frozen read-only after module load)
+PROMPTS: Mapping[str, PromptSpec] = MappingProxyType({
     "skeleton.v1": PromptSpec(
         id="skeleton.v1",
         purpose="Structured writing with fixed sections",
@@ -182,7 +262,16 @@ PROMPTS: Dict[str, PromptSpec] = {
         temperature=0.0,
         max_tokens=20,
     ),
-}
+})
+
+# Compile render fast paths once at import time
+for _spec in PROMPTS.values():
+    _spec._format_str = _to_format_string(_spec.template)
+    _spec._render_fn = _build_render_fn(_spec.template)
+
+# Precomputed key views so hot paths don't rebuild lists/strings per call
+_PROMPT_KEYS_TUPLE = tuple(PROMPTS.keys())
+_PROMPT_KEYS_STR = ", ".join(_PROMPT_KEYS_TUPLE)
 
 
 def render(prompt_id: str, **vars) -> Tuple[str, PromptSpec]:
@@ -206,14 +295,18 @@ def render(prompt_id: str, **vars) -> Tuple[str, PromptSpec]:
         ...                     constraints="Max 50 words",
         ...                     format="Plain text")
     """
-    if prompt_id not in PROMPTS:
+    try:
+        spec = PROMPTS[prompt_id]
+    except KeyError:
         raise KeyError(
             f"Prompt '{prompt_id}' not found. "
-            f"Available: {', '.join(PROMPTS.keys())}"
-        )
+            f"Available: {_PROMPT_KEYS_STR}"
+        ) from None
 
-    spec = PROMPTS[prompt_id]
-    text = Template(spec.template).safe_substitute(**vars)
+    if spec._render_fn is not None:
+        text = spec._render_fn(**vars)
+    else:
+        text = spec._format_str.format_map(_SafeDict(vars))
     return text, spec
 
 
@@ -224,7 +317,7 @@ def list_prompts() -> List[str]:
     Returns:
         List of prompt identifiers
     """
-    return list(PROMPTS.keys())
+    return list(_PROMPT_KEYS_TUPLE)
 
 
 def get_prompt_info(prompt_id: str) -> PromptSpec:
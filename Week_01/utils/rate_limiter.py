@@ -0,0 +1,118 @@
+"""
+Client-side token-bucket rate limiting.
+
+Retrying on 429 is reactive; admitting requests through per-provider
+buckets sized to the account's RPM/TPM quotas keeps throughput at the
+actual limit instead of sawtoothing between bursts and backoffs.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """
+    Classic token bucket: capacity tokens, refilled at rate_per_sec.
+
+    acquire() blocks (or awaits, via aacquire) until the requested cost
+    is available, so callers are paced to the configured rate.
+    """
+
+    def __init__(self, rate_per_sec: float, capacity: float):
+        """
+        Initialize bucket.
+
+        Args:
+            rate_per_sec: Refill rate in tokens per second
+            capacity: Maximum tokens the bucket can hold (burst size)
+        """
+        self.rate_per_sec = rate_per_sec
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add tokens accrued since the last refill. Caller holds _lock."""
+        now = time.monotonic()
+        elapsed = now - self._last_refill
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_sec)
+            self._last_refill = now
+
+    def _reserve(self, cost: float) -> float:
+        """
+        Take cost tokens, returning seconds to wait before proceeding.
+
+        Returns 0.0 when the bucket already has enough tokens.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= cost
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate_per_sec
+
+    def acquire(self, cost: float = 1.0) -> float:
+        """
+        Block until cost tokens are available.
+
+        Args:
+            cost: Tokens to consume (e.g., 1 request or N prompt tokens)
+
+        Returns:
+            Seconds actually waited
+        """
+        wait = self._reserve(cost)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self, cost: float = 1.0) -> float:
+        """
+        Await until cost tokens are available without blocking the loop.
+
+        Args:
+            cost: Tokens to consume
+
+        Returns:
+            Seconds actually waited
+        """
+        wait = self._reserve(cost)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+# Shared per-provider buckets so every LLMClient instance in the process
+# counts against the same quota
+_BUCKETS: dict[tuple[str, str], TokenBucket] = {}
+_BUCKETS_LOCK = threading.Lock()
+
+
+def get_shared_bucket(
+    provider: str, kind: str, per_minute: Optional[float]
+) -> Optional[TokenBucket]:
+    """
+    Get (or create) the process-wide bucket for a provider quota.
+
+    Args:
+        provider: API provider (openai, google, groq)
+        kind: Quota kind ("rpm" or "tpm")
+        per_minute: Quota per minute, or None to disable limiting
+
+    Returns:
+        Shared TokenBucket or None when no limit is configured
+    """
+    if not per_minute:
+        return None
+
+    key = (provider, kind)
+    with _BUCKETS_LOCK:
+        if key not in _BUCKETS:
+            _BUCKETS[key] = TokenBucket(
+                rate_per_sec=per_minute / 60.0, capacity=per_minute
+            )
+        return _BUCKETS[key]
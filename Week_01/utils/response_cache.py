@@ -0,0 +1,108 @@
+"""
+Exact-match response caching for deterministic LLM calls.
+
+Temperature-0 calls with identical (model, messages, tools) are re-issued
+constantly during development and evals; serving them from a local cache
+turns a network round-trip + GPU prefill into a dict lookup.
+
+Backed by diskcache (persistent across runs) when installed, otherwise an
+in-memory dict with expiry.
+"""
+
+import hashlib
+import json
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+
+class ResponseCache:
+    """Exact-hash cache mapping request fingerprints to response text."""
+
+    def __init__(self, directory: Optional[str] = None, expire: int = 86400):
+        """
+        Initialize cache.
+
+        Args:
+            directory: On-disk cache location (used only with diskcache)
+            expire: Entry lifetime in seconds
+        """
+        self.expire = expire
+        if diskcache is not None:
+            self._cache = diskcache.Cache(directory or ".llm_response_cache")
+            self._memory: Optional[Dict[str, tuple[float, str]]] = None
+        else:
+            self._cache = None
+            self._memory = {}
+            self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Build a stable fingerprint for a request.
+
+        Every parameter that changes the response must be hashed — e.g.
+        response_format (json_chat vs plain chat) and max_tokens — or
+        distinct requests would collide on one entry.
+        """
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temp": temperature,
+                "max_tokens": max_tokens,
+                "extra": extra,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached response text, or None on miss/expiry."""
+        if self._cache is not None:
+            return self._cache.get(key)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None:
+                return None
+            stored_at, text = entry
+            if time.time() - stored_at > self.expire:
+                del self._memory[key]
+                return None
+            return text
+
+    def set(self, key: str, text: str) -> None:
+        """Store response text under key."""
+        if self._cache is not None:
+            self._cache.set(key, text, expire=self.expire)
+            return
+
+        with self._lock:
+            self._memory[key] = (time.time(), text)
+
+
+# Process-wide cache shared by all LLMClient instances
+_default_cache: Optional[ResponseCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ResponseCache:
+    """Get the shared ResponseCache, creating it on first use."""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
@@ -6,10 +6,32 @@ Automatically selects appropriate model tier based on prompt technique:
 - General techniques → general models
 """
 
+import re
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import Literal, Optional
 
+# Technique-classification keywords, hoisted to module scope and compiled
+# once: one regex-alternation pass replaces N Python substring checks per
+# routing call
+_REASON_KEYWORDS = frozenset({"cot", "tot", "reason", "think"})
+_STRONG_KEYWORDS = frozenset({"strong", "complex", "advanced"})
+_REASON_RE = re.compile("|".join(map(re.escape, sorted(_REASON_KEYWORDS))))
+_STRONG_RE = re.compile("|".join(map(re.escape, sorted(_STRONG_KEYWORDS))))
+
+
+@lru_cache(maxsize=None)
+def _load_models_yaml(path_str: str, mtime: float) -> dict:
+    """
+    Load and cache models.yaml, keyed by path + modification time.
+
+    The mtime key invalidates the cache automatically when the file is
+    edited, so repeated routing calls skip disk I/O and YAML parsing.
+    """
+    with open(path_str, "r") as f:
+        return yaml.safe_load(f)
+
 
 def pick_model(
     provider: Literal["openai", "google", "groq"],
@@ -56,8 +78,7 @@ def pick_model(
             f"Current working directory: {Path.cwd()}"
         )
 
-    with open(config_file, "r") as f:
-        config = yaml.safe_load(f)
+    config = _load_models_yaml(str(config_file), config_file.stat().st_mtime)
 
     if provider not in config:
         raise KeyError(f"Provider '{provider}' not found in {config_path}")
@@ -67,20 +88,17 @@ def pick_model(
         technique_lower = technique.lower()
 
         # Reasoning techniques require reasoning models
-        if any(x in technique_lower for x in ["cot", "tot", "reason", "think"]):
+        if _REASON_RE.search(technique_lower):
             tier = "reason"
         # Strong/complex techniques benefit from stronger models
-        elif any(x in technique_lower for x in ["strong", "complex", "advanced"]):
+        elif _STRONG_RE.search(technique_lower):
             tier = "strong"
         # Default to general tier
         else:
             tier = "general"
 
-    if tier not in config[provider]:
-        # Fallback to general if requested tier not available
-        tier = "general"
-
-    return config[provider][tier]
+    # Fallback to general if requested tier not available
+    return config[provider].get(tier, config[provider]["general"])
 
 
 def list_available_models(config_path: str = "config/models.yaml") -> dict[str, dict]:
@@ -104,10 +122,26 @@ def list_available_models(config_path: str = "config/models.yaml") -> dict[str,
     if not config_file.exists():
         return {}
 
-    with open(config_file, "r") as f:
-        return yaml.safe_load(f)
+    return _load_models_yaml(str(config_file), config_file.stat().st_mtime)
 
 
+# Precompiled (pattern, size) rules for context window lookup, checked in
+# order — one regex match per rule instead of repeated substring scans
+# (approximate values — check provider docs for exact limits)
+_CONTEXT_WINDOWS = (
+    # OpenAI models
+    (re.compile(r"gpt-4o|o[13]"), 128_000),
+    (re.compile(r"gpt-4"), 128_000),
+    (re.compile(r"gpt-3\.5"), 16_385),
+    # Google Gemini models
+    (re.compile(r"gemini-[12]\.[05]"), 1_000_000),
+    # Groq models
+    (re.compile(r"llama-3\.[12]"), 131_072),
+    (re.compile(r"deepseek-r1"), 65_536),
+)
+
+
+@lru_cache(maxsize=256)
 def get_context_window(model: str) -> int:
     """
     Get approximate context window size for a model.
@@ -120,27 +154,9 @@ def get_context_window(model: str) -> int:
     Returns:
         Context window size in tokens
     """
-    # OpenAI models
-    if "gpt-4o" in model or "o3" in model or "o1" in model:
-        return 128_000
-    if "gpt-4" in model:
-        return 128_000
-    if "gpt-3.5" in model:
-        return 16_385
-
-    # Google Gemini models
-    if "gemini-2.0" in model:
-        return 1_000_000
-    if "gemini-1.5" in model:
-        return 1_000_000
-
-    # Groq models
-    if "llama-3.1" in model:
-        return 131_072
-    if "deepseek-r1" in model:
-        return 65_536
-    if "llama-3.2" in model:
-        return 131_072
+    for pattern, size in _CONTEXT_WINDOWS:
+        if pattern.search(model):
+            return size
 
     # Default conservative estimate
     return 8_000
@@ -161,12 +177,28 @@ def should_use_reasoning_model(technique: str) -> bool:
     if not should_auto_route_reasoning():
         return False
     
+    techniques = tuple(get_reasoning_techniques())
+    if not techniques:
+        return False
+
     technique_lower = technique.lower()
-    reasoning_techniques = get_reasoning_techniques()
-    
-    # Check exact matches first
-    if technique_lower in reasoning_techniques:
-        return True
-    
-    # Check substring matches
-    return any(keyword in technique_lower for keyword in reasoning_techniques)
\ No newline at end of file
+    techniques_set, techniques_re = _reasoning_matchers(techniques)
+
+    # Check exact matches first (set lookup), then one regex pass for
+    # substring matches
+    return technique_lower in techniques_set or bool(
+        techniques_re.search(technique_lower)
+    )
+
+
+@lru_cache(maxsize=8)
+def _reasoning_matchers(techniques: tuple[str, ...]) -> tuple[frozenset, re.Pattern]:
+    """
+    Build (exact-match set, substring regex) for configured techniques.
+
+    Callers must not pass an empty tuple — joining zero alternatives
+    compiles the empty pattern, which matches everything.
+    """
+    return frozenset(techniques), re.compile(
+        "|".join(map(re.escape, sorted(techniques)))
+    )
\ No newline at end of file
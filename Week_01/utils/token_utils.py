@@ -8,10 +8,58 @@ This module provides:
 - Context-fit guards with summarize/truncate strategies
 """
 
+import hashlib
 import tiktoken
+from functools import lru_cache
 from typing import Literal, Optional, Any
 
+# Per-message token-count cache keyed by (encoding, content hash). Stable
+# prefixes — a fixed system prompt reused across thousands of calls — hit
+# this cache instead of re-running BPE. Keep such prefixes byte-identical
+# (no timestamps in system prompts): that is also what lets providers with
+# implicit prompt caching (OpenAI/Gemini) reuse their server-side KV cache.
+_MSG_TOKEN_CACHE: dict[tuple[str, bytes], int] = {}
+_MSG_TOKEN_CACHE_MAX = 1024
 
+
+def _cached_token_lens(enc: tiktoken.Encoding, texts: list[str]) -> list[int]:
+    """
+    Token lengths for texts, memoizing per (encoding, content-hash).
+
+    Unseen texts are encoded in one encode_batch call; repeats (shared
+    system prompts, reused RAG chunks) are a dict lookup.
+    """
+    lens: list[Optional[int]] = [None] * len(texts)
+    misses: list[tuple[int, tuple[str, bytes]]] = []
+
+    for i, text in enumerate(texts):
+        key = (enc.name, hashlib.blake2b(text.encode(), digest_size=8).digest())
+        cached = _MSG_TOKEN_CACHE.get(key)
+        if cached is None:
+            misses.append((i, key))
+        else:
+            lens[i] = cached
+
+    if misses:
+        encoded = enc.encode_batch(
+            [texts[i] for i, _ in misses], disallowed_special=()
+        )
+        if len(_MSG_TOKEN_CACHE) + len(misses) > _MSG_TOKEN_CACHE_MAX:
+            _MSG_TOKEN_CACHE.clear()
+        for (i, key), tokens in zip(misses, encoded):
+            lens[i] = len(tokens)
+            _MSG_TOKEN_CACHE[key] = lens[i]
+
+    return lens
+
+
+@lru_cache(maxsize=8)
+def _get_encoding(name: str) -> tiktoken.Encoding:
+    """Fetch a tiktoken encoding once; registry lookup + BPE load are costly."""
+    return tiktoken.get_encoding(name)
+
+
+@lru_cache(maxsize=64)
 def pick_encoding(
     provider: Literal["openai", "google", "groq"], model: str
 ) -> tiktoken.Encoding:
@@ -32,33 +80,79 @@ def pick_encoding(
         # For GPT-4o, GPT-4, o3 models, prefer o200k_base
         if any(x in model.lower() for x in ["gpt-4o", "gpt-4", "o3", "o1"]):
             try:
-                return tiktoken.get_encoding("o200k_base")
+                return _get_encoding("o200k_base")
             except Exception:
                 pass
         # Fallback to cl100k_base for GPT-3.5 and older
-        return tiktoken.get_encoding("cl100k_base")
+        return _get_encoding("cl100k_base")
 
     # For non-OpenAI providers, use o200k_base as approximation
     # Note: This is an approximation only; actual tokenization may differ
-    return tiktoken.get_encoding("o200k_base")
+    return _get_encoding("o200k_base")
+
+
+# Strings shorter than this are worth caching; the ~4-chars-per-token
+# heuristic also only applies below it
+_SHORT_TEXT_LEN = 256
+
+
+@lru_cache(maxsize=64)
+def _message_overhead(
+    provider: Literal["openai", "google", "groq"], model: str
+) -> tuple[int, int]:
+    """
+    Per-message framing overhead as (tokens_per_message, tokens_per_name).
+
+    OpenAI's chat format costs 3 tokens per message on current models
+    (4 on gpt-3.5-turbo-0301) plus 1 per optional name field (-1 on 0301,
+    where name replaces role). A flat 4 systematically over-estimated on
+    gpt-4o and biased the hard_prompt_cap guard. Non-OpenAI providers keep
+    4 as a conservative approximation.
+    """
+    if provider == "openai":
+        if "gpt-3.5-turbo-0301" in model:
+            return (4, -1)
+        return (3, 1)
+    return (4, 1)
+
+
+@lru_cache(maxsize=4096)
+def _cached_encode_len(text: str, enc_name: str) -> int:
+    """Token length of a short string, memoized per encoding."""
+    return len(_get_encoding(enc_name).encode(text, disallowed_special=()))
 
 
 def count_text_tokens(
-    text: str, provider: Literal["openai", "google", "groq"], model: str
+    text: str,
+    provider: Literal["openai", "google", "groq"],
+    model: str,
+    fast: bool = False,
 ) -> int:
     """
     Count tokens in a text string.
 
+    Short strings hit an lru_cache instead of re-running BPE. With
+    fast=True, short ASCII strings use the ~4-chars-per-token heuristic
+    (within a few percent of tiktoken, ~100x faster) — only for estimates
+    where precision doesn't matter.
+
     Args:
         text: Input text
         provider: API provider
         model: Model identifier
+        fast: Allow the heuristic estimate for short ASCII strings
 
     Returns:
         Estimated token count
     """
     if not text:
         return 0
+
+    if len(text) < _SHORT_TEXT_LEN:
+        if fast and text.isascii():
+            return max(1, len(text) // 4)
+        return _cached_encode_len(text, pick_encoding(provider, model).name)
+
     enc = pick_encoding(provider, model)
     return len(enc.encode(text, disallowed_special=()))
 
@@ -87,23 +181,24 @@ def count_messages_tokens(
     """
     enc = pick_encoding(provider, model)
 
-    # Count input tokens (system + user messages)
-    input_tokens = 0
+    # Count input tokens (system + user messages) in one batched call —
+    # encode_batch crosses into the Rust core once and parallelizes there,
+    # vs. one FFI round-trip per message.
+    # Stable prefixes (shared system prompts) resolve from the token cache.
+    per_message, per_name = _message_overhead(provider, model)
+    texts = [msg.get("content", "") for msg in messages]
+    input_tokens = per_message * len(messages) + sum(_cached_token_lens(enc, texts))
     for msg in messages:
-        role = msg.get("role", "")
-        content = msg.get("content", "")
-        # Add role overhead (typically ~4 tokens per message in OpenAI format)
-        input_tokens += 4
-        input_tokens += len(enc.encode(content, disallowed_special=()))
+        if "name" in msg:
+            input_tokens += per_name
 
     # Count context tokens separately
     context_tokens = 0
     if context_strs:
-        for ctx in context_strs:
-            context_tokens += len(enc.encode(ctx, disallowed_special=()))
+        context_tokens = sum(_cached_token_lens(enc, list(context_strs)))
 
-    # Add base overhead for message formatting
-    overhead = 3  # for message array structure
+    # Every reply is primed with <|start|>assistant<|message|>
+    overhead = 3
 
     return {
         "input_tokens": input_tokens,
@@ -215,30 +310,49 @@ def fit_within_context(
         system_msgs = [m for m in adjusted if m.get("role") == "system"]
         other_msgs = [m for m in adjusted if m.get("role") != "system"]
 
+        # Tokenize each message once and keep a running total — re-encoding
+        # everything per iteration made the loop O(N^2) in BPE work
+        enc = pick_encoding(provider, model)
+        per_message, _ = _message_overhead(provider, model)
+        sys_tokens = per_message * len(system_msgs) + sum(
+            len(tokens)
+            for tokens in enc.encode_batch(
+                [m.get("content", "") for m in system_msgs], disallowed_special=()
+            )
+        )
+        # Keep the token lists: the content-truncation branch below slices
+        # them directly instead of re-encoding the surviving message
+        msg_tokens = enc.encode_batch(
+            [m.get("content", "") for m in other_msgs], disallowed_special=()
+        )
+        per_msg = [per_message + len(tokens) for tokens in msg_tokens]
+        ctx_tokens = 0
+        if context_strs:
+            ctx_tokens = sum(
+                len(tokens)
+                for tokens in enc.encode_batch(context_strs, disallowed_special=())
+            )
+        running = sys_tokens + sum(per_msg) + ctx_tokens + 3
+
         # Truncate from the beginning, but always keep at least the last user message
-        while len(other_msgs) > 1 and estimate_prompt_tokens(
-            system_msgs + other_msgs, provider, model, context_strs
-        ) > max_context_tokens:
+        while len(other_msgs) > 1 and running > max_context_tokens:
+            running -= per_msg.pop(0)
             other_msgs.pop(0)
+            msg_tokens.pop(0)
 
         # If still over budget, truncate the content of the last message
-        if estimate_prompt_tokens(
-            system_msgs + other_msgs, provider, model, context_strs
-        ) > max_context_tokens and other_msgs:
+        if running > max_context_tokens and other_msgs:
             # Truncate the last message's content to fit
             last_msg = other_msgs[-1]
-            enc = pick_encoding(provider, model)
-            
+
             # Calculate available tokens for content (accounting for overhead)
-            overhead = 4 * (len(system_msgs) + 1) + 3  # role overhead + base
+            overhead = per_message * (len(system_msgs) + 1) + 3  # role + priming
             available_tokens = max_context_tokens - overhead
-            
-            # Encode and truncate
-            content = last_msg.get("content", "")
-            tokens = enc.encode(content, disallowed_special=())
+
+            # Slice the already-encoded tokens — no second BPE pass
+            tokens = msg_tokens[-1]
             if len(tokens) > available_tokens:
-                tokens = tokens[:available_tokens]
-                truncated_content = enc.decode(tokens)
+                truncated_content = enc.decode(tokens[:available_tokens])
                 other_msgs[-1] = {**last_msg, "content": truncated_content + "... [truncated]"}
 
         return (
@@ -265,4 +379,106 @@ def fit_within_context(
             },
         )
 
-    return messages, context_strs, {"overflow": False}
\ No newline at end of file
+    return messages, context_strs, {"overflow": False}
+
+
+def plan_call(
+    messages: list[dict[str, str]],
+    provider: Literal["openai", "google", "groq"],
+    model: str,
+    hard_cap: Optional[int] = None,
+    context_strs: Optional[list[str]] = None,
+) -> tuple[list[dict[str, str]], Optional[list[str]], dict[str, int], dict[str, Any]]:
+    """
+    Single-pass call planner: counts, fits within cap, and recounts.
+
+    Fuses the count → fit_within_context → recount sequence the client
+    used to run, tokenizing each message exactly once and updating the
+    totals by delta as messages are dropped — overflow no longer triples
+    the BPE work.
+
+    Args:
+        messages: Messages array
+        provider: API provider
+        model: Model identifier
+        hard_cap: Optional hard prompt-token limit (None = no fitting)
+        context_strs: Optional context strings
+
+    Returns:
+        Tuple of (final_messages, final_context, token_counts, overflow_meta)
+    """
+    enc = pick_encoding(provider, model)
+    per_message, per_name = _message_overhead(provider, model)
+
+    per_msg = _cached_token_lens(enc, [m.get("content", "") for m in messages])
+    input_tokens = per_message * len(messages) + sum(per_msg)
+    for msg in messages:
+        if "name" in msg:
+            input_tokens += per_name
+    context_tokens = 0
+    if context_strs:
+        context_tokens = sum(_cached_token_lens(enc, list(context_strs)))
+    total = input_tokens + context_tokens + 3
+
+    counts = {
+        "input_tokens": input_tokens,
+        "context_tokens": context_tokens,
+        "estimated_total": total,
+    }
+
+    if not hard_cap or total <= hard_cap:
+        return messages, context_strs, counts, {"overflow": False, "original_tokens": total}
+
+    # Overflow: truncate oldest non-system messages using the per-message
+    # counts we already have (keep system messages and the last message)
+    system_msgs = []
+    other_msgs = []
+    other_lens = []
+    for msg, msg_len in zip(messages, per_msg):
+        if msg.get("role") == "system":
+            system_msgs.append(msg)
+        else:
+            other_msgs.append(msg)
+            other_lens.append(
+                per_message + msg_len + (per_name if "name" in msg else 0)
+            )
+
+    running = total
+    while len(other_msgs) > 1 and running > hard_cap:
+        running -= other_lens.pop(0)
+        other_msgs.pop(0)
+
+    # If still over budget, truncate the content of the last message
+    # (the one place a re-encode is unavoidable: we need its token ids)
+    if running > hard_cap and other_msgs:
+        last_msg = other_msgs[-1]
+        overhead = per_message * (len(system_msgs) + 1) + 3
+        available_tokens = hard_cap - overhead
+
+        tokens = enc.encode(last_msg.get("content", ""), disallowed_special=())
+        if len(tokens) > available_tokens:
+            running -= other_lens[-1]
+            tokens = tokens[:available_tokens]
+            truncated_content = enc.decode(tokens) + "... [truncated]"
+            other_msgs[-1] = {**last_msg, "content": truncated_content}
+            other_lens[-1] = (
+                per_message
+                + len(enc.encode(truncated_content, disallowed_special=()))
+                + (per_name if "name" in last_msg else 0)
+            )
+            running += other_lens[-1]
+
+    final_messages = system_msgs + other_msgs
+    final_input = running - context_tokens - 3
+    counts = {
+        "input_tokens": final_input,
+        "context_tokens": context_tokens,
+        "estimated_total": running,
+    }
+    meta = {
+        "overflow": True,
+        "original_tokens": total,
+        "strategy": "truncate",
+        "messages_removed": len(messages) - len(final_messages),
+    }
+    return final_messages, context_strs, counts, meta
\ No newline at end of file